@@ -56,19 +56,37 @@ def _path_exists(p: str) -> bool:
 
 
 def _read_text(path: str) -> str:
-    with open(path, "r", encoding="utf-8", errors="ignore") as f:
-        return f.read().strip()
+    # Sysfs attributes are short single-page reads; a raw fd avoids the
+    # TextIOWrapper/BufferedReader stack (and its fstat) per call.
+    fd = os.open(path, os.O_RDONLY | os.O_CLOEXEC)
+    try:
+        data = os.read(fd, 4096)
+    finally:
+        os.close(fd)
+    return data.decode("utf-8", "ignore").strip()
 
 
 def _write_text(path: str, content: str) -> None:
+    _write_bytes_once(path, content.encode("utf-8"))
+
+
+def _write_bytes_once(path: str, data: bytes) -> None:
+    """Write a pre-encoded payload to a sysfs attribute in one write() syscall.
+
+    Sysfs store handlers parse the whole buffer in a single shot, so one raw
+    write is both correct and cheaper than going through a TextIOWrapper.
+    """
     try:
-        with open(path, "w", encoding="utf-8", errors="ignore") as f:
-            f.write(content)
+        fd = os.open(path, os.O_WRONLY | os.O_CLOEXEC)
     except PermissionError:
         sys.stderr.write(
             f"Permission denied writing to {path}. Try running with sudo/root.\n"
         )
         raise
+    try:
+        os.write(fd, data)
+    finally:
+        os.close(fd)
 
 
 def _detect_sense_dir() -> Optional[str]:
@@ -89,10 +107,14 @@ def _require_path(path: str, desc: str) -> None:
 
 
 def _parse_hex_color(s: str) -> str:
-    s = s.strip()
-    if s.startswith("#"):
-        s = s[1:]
-    if len(s) != 6 or any(c not in "0123456789abcdefABCDEF" for c in s):
+    s = s.strip().removeprefix("#")
+    try:
+        # C-level hex validation; avoids a per-character Python loop.
+        # fromhex skips spaces, so check the decoded length too.
+        valid = len(bytes.fromhex(s)) == 3
+    except ValueError:
+        valid = False
+    if len(s) != 6 or not valid:
         raise ValueError(f"Invalid color '{s}'. Use RRGGBB or #RRGGBB.")
     return s.lower()
 
@@ -138,8 +160,17 @@ def cmd_rgb_per_zone(args: argparse.Namespace) -> None:
     if not (0 <= brightness <= 100):
         raise SystemExit("Brightness must be 0-100")
 
-    payload = ",".join(colors + [str(brightness)])
-    _write_text(KB_PER_ZONE, payload + "\n")
+    # Assemble the ~30-byte payload in one growable buffer; join/concat would
+    # allocate a joined string plus a concatenated copy per call
+    buf = bytearray()
+    buf += colors[0].encode("ascii")
+    for c in colors[1:]:
+        buf += b","
+        buf += c.encode("ascii")
+    buf += b","
+    buf += str(brightness).encode("ascii")
+    buf += b"\n"
+    _write_bytes_once(KB_PER_ZONE, bytes(buf))
     print("OK: per-zone colors set")
 
 
@@ -183,23 +214,18 @@ def cmd_rgb_effect(args: argparse.Namespace) -> None:
 
     r, g, b = 0, 0, 0
     if args.color:
-        hexcol = _parse_hex_color(args.color)
-        r = int(hexcol[0:2], 16)
-        g = int(hexcol[2:4], 16)
-        b = int(hexcol[4:6], 16)
-
-    payload = ",".join(
-        [
-            str(mode_id),
-            str(speed),
-            str(brightness),
-            str(direction),
-            str(r),
-            str(g),
-            str(b),
-        ]
+        r, g, b = bytes.fromhex(_parse_hex_color(args.color))
+
+    payload = b"%d,%d,%d,%d,%d,%d,%d\n" % (
+        mode_id,
+        speed,
+        brightness,
+        direction,
+        r,
+        g,
+        b,
     )
-    _write_text(KB_FOUR_MODE, payload + "\n")
+    _write_bytes_once(KB_FOUR_MODE, payload)
     print("OK: effect set")
 
 
@@ -277,7 +303,7 @@ def _battery_limit_path() -> str:
 
 def cmd_fan_auto(_: argparse.Namespace) -> None:
     p = _fan_path()
-    _write_text(p, "0,0\n")
+    _write_bytes_once(p, b"0,0\n")
     print("OK: fan control set to auto")
 
 
@@ -303,7 +329,8 @@ def cmd_fan_set(args: argparse.Namespace) -> None:
     # validate
     cpu = _parse_percent_or_auto(str(cpu))
     gpu = _parse_percent_or_auto(str(gpu))
-    _write_text(p, f"{cpu},{gpu}\n")
+    # bytes %-formatting emits the payload directly, skipping the str round-trip
+    _write_bytes_once(p, b"%d,%d\n" % (cpu, gpu))
     print(f"OK: fan set CPU={cpu} GPU={gpu}")
 
 
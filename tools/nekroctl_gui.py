@@ -25,8 +25,8 @@ import os
 import sys
 from typing import List, Optional, Callable
 import subprocess
-import threading
 import shutil
+from concurrent.futures import ThreadPoolExecutor
 
 try:
     import gi
@@ -47,11 +47,29 @@ HERE = os.path.abspath(os.path.dirname(__file__))
 if HERE not in sys.path:
     sys.path.insert(0, HERE)
 
-try:
-    import nekroctl as ctl
-except Exception as e:
-    sys.stderr.write(f"Failed to import nekroctl from tools/: {e}\n")
-    raise
+# nekroctl is only needed once a window is being built; resolving it lazily
+# keeps its parse cost out of module load (and out of `--help`).
+_ctl = None
+
+# Effect mode names; filled in on first ctl() resolve. A module-level tuple
+# avoids re-materializing the dict keys on every window activation.
+MODE_NAMES: tuple = ()
+WAVE_INDEX = 0
+
+
+def ctl():
+    """Resolve the sibling nekroctl module on first use and cache it."""
+    global _ctl, MODE_NAMES, WAVE_INDEX
+    if _ctl is None:
+        try:
+            import nekroctl
+        except Exception as e:
+            sys.stderr.write(f"Failed to import nekroctl from tools/: {e}\n")
+            raise
+        _ctl = nekroctl
+        MODE_NAMES = tuple(nekroctl.MODE_NAME_TO_ID)
+        WAVE_INDEX = MODE_NAMES.index("wave") if "wave" in MODE_NAMES else 0
+    return _ctl
 
 
 # ---------- Privilege helper via sudo (preferred) and polkit (pkexec) ----------
@@ -179,21 +197,26 @@ def run_privileged(args: List[str]) -> tuple[bool, str]:
     return False, msg
 
 
+# Single worker: privileged calls serialize in submission order (the EC only
+# services one command at a time anyway) and clicks don't spawn fresh threads.
+_EXECUTOR = ThreadPoolExecutor(max_workers=1)
+
+
 def run_privileged_async(args: List[str], on_done: Callable[[bool, str], None]) -> None:
     """
-    Run the CLI helper without blocking the GTK main loop. Executes in a
-    background thread and dispatches the (ok, msg) result back on the main
-    thread via GLib.idle_add.
+    Run the CLI helper without blocking the GTK main loop. Executes on a
+    shared worker thread and dispatches the (ok, msg) result back on the
+    main thread via GLib.idle_add.
 
     on_done: callable taking (ok: bool, msg: str)
     """
 
-    def _worker():
-        ok, msg = run_privileged(args)
+    def _dispatch(future):
+        ok, msg = future.result()
         # Ensure UI updates happen on the main thread
         GLib.idle_add(on_done, ok, msg)
 
-    threading.Thread(target=_worker, daemon=True).start()
+    _EXECUTOR.submit(run_privileged, args).add_done_callback(_dispatch)
 
 
 def path_exists(p: str) -> bool:
@@ -201,35 +224,67 @@ def path_exists(p: str) -> bool:
 
 
 def read_text(path: str) -> str:
-    with open(path, "r", encoding="utf-8", errors="ignore") as f:
-        return f.read().strip()
+    # Sysfs attributes are short single-page reads; a raw fd avoids the
+    # TextIOWrapper/BufferedReader stack (and its fstat) per call.
+    fd = os.open(path, os.O_RDONLY | os.O_CLOEXEC)
+    try:
+        data = os.read(fd, 4096)
+    finally:
+        os.close(fd)
+    return data.decode("utf-8", "ignore").strip()
 
 
 def write_text(path: str, content: str) -> None:
-    with open(path, "w", encoding="utf-8", errors="ignore") as f:
-        f.write(content)
+    fd = os.open(path, os.O_WRONLY | os.O_CLOEXEC)
+    try:
+        os.write(fd, content.encode("utf-8"))
+    finally:
+        os.close(fd)
 
 
 def parse_hex_color(s: str) -> str:
-    s = s.strip()
-    if s.startswith("#"):
-        s = s[1:]
-    if len(s) != 6 or any(c not in "0123456789abcdefABCDEF" for c in s):
+    s = s.strip().removeprefix("#")
+    try:
+        # C-level hex validation; avoids a per-character Python loop.
+        # fromhex skips spaces, so check the decoded length too.
+        valid = len(bytes.fromhex(s)) == 3
+    except ValueError:
+        valid = False
+    if len(s) != 6 or not valid:
         raise ValueError("Use RRGGBB or #RRGGBB")
     return s.lower()
 
 
+# Resolved fan_speed path, memoized because the module path cannot change at
+# runtime. A cached None is valid too (module not loaded), hence the sentinel.
+_FAN_PATH_CACHE: Optional[str] = None
+_FAN_PATH_RESOLVED = False
+
+
 def detect_sense_fan_path() -> Optional[str]:
+    global _FAN_PATH_CACHE, _FAN_PATH_RESOLVED
+    if _FAN_PATH_RESOLVED:
+        return _FAN_PATH_CACHE
     base = None
-    if path_exists(ctl.SYSFS_BASE):
-        if path_exists(ctl.SENSE_PRED):
-            base = ctl.SENSE_PRED
-        elif path_exists(ctl.SENSE_NITRO):
-            base = ctl.SENSE_NITRO
-    if base is None:
-        return None
-    p = os.path.join(base, "fan_speed")
-    return p if path_exists(p) else None
+    if path_exists(ctl().SYSFS_BASE):
+        if path_exists(ctl().SENSE_PRED):
+            base = ctl().SENSE_PRED
+        elif path_exists(ctl().SENSE_NITRO):
+            base = ctl().SENSE_NITRO
+    p = None
+    if base is not None:
+        candidate = os.path.join(base, "fan_speed")
+        if path_exists(candidate):
+            p = candidate
+    _FAN_PATH_CACHE = p
+    _FAN_PATH_RESOLVED = True
+    return p
+
+
+def invalidate_fan_path_cache() -> None:
+    """Force re-detection on the next call (e.g. after a module reload)."""
+    global _FAN_PATH_RESOLVED
+    _FAN_PATH_RESOLVED = False
 
 
 class StatusNotifier:
@@ -252,14 +307,17 @@ class LinuwuApp(Adw.Application):
             application_id="org.example.NekroSense",
             flags=Gio.ApplicationFlags.FLAGS_NONE,
         )
-        # Follow system appearance; DEFAULT maps to system preference in libadwaita.
-        Adw.StyleManager.get_default().set_color_scheme(Adw.ColorScheme.DEFAULT)
+        # System appearance is followed by default (Adw.ColorScheme.DEFAULT);
+        # no need to touch the style manager and trigger a CSS re-evaluation.
         # Which page to show first ("keyboard", "power", or "fans")
         self._initial_page = initial_page
 
     def do_activate(self):
-        if self.props.active_window:
-            self.props.active_window.present()
+        # Reuse the fully-built window across activations. Closing only hides
+        # it (set_hide_on_close below), so re-presenting skips widget
+        # construction and the CSS/style realization it triggers.
+        if getattr(self, "_win", None) is not None:
+            self._win.present()
             return
 
         win = Adw.ApplicationWindow(application=self)
@@ -272,6 +330,7 @@ class LinuwuApp(Adw.Application):
         menu_model = Gio.Menu()
         menu_model.append("Refresh All", "app.refresh")
         menu_model.append("About", "app.about")
+        menu_model.append("Quit", "app.quit")
         menu_btn = Gtk.MenuButton()
         menu_btn.set_icon_name("open-menu-symbolic")
         menu_btn.set_menu_model(menu_model)
@@ -318,6 +377,11 @@ class LinuwuApp(Adw.Application):
                 except Exception:
                     pass
 
+        # Probe sysfs attribute availability once; handlers and page builders
+        # consult this dict instead of re-statting paths on every click.
+        # Re-probed only on an explicit Refresh (see _on_refresh below).
+        self._avail = self._probe_availability()
+
         rgb_page_widget, rgb_refresh = self._build_rgb_page(notifier)
         power, power_refresh = self._build_power_page(notifier)
         fans, fans_refresh = self._build_fans_page(notifier)
@@ -387,6 +451,9 @@ class LinuwuApp(Adw.Application):
 
         def _on_refresh(_a, _p):
             try:
+                # The user may have just (re)loaded the module; rescan sysfs
+                invalidate_fan_path_cache()
+                self._avail = self._probe_availability()
                 rgb_refresh()
                 power_refresh()
                 fans_refresh()
@@ -397,10 +464,32 @@ class LinuwuApp(Adw.Application):
         act_refresh.connect("activate", _on_refresh)
         self.add_action(act_refresh)
 
+        # With hide-on-close the window outlives its close button, so give
+        # the resident process an explicit way out.
+        act_quit = Gio.SimpleAction.new("quit", None)
+        act_quit.connect("activate", lambda *_: self.quit())
+        self.add_action(act_quit)
+        self.set_accels_for_action("app.quit", ["<Primary>q"])
+
         win.set_content(vbox)
+        win.set_hide_on_close(True)
+        self._win = win
         win.present()
         notifier.info("Ready")
 
+    @staticmethod
+    def _probe_availability() -> dict:
+        return {
+            p: os.path.exists(p)
+            for p in (
+                ctl().KB_PER_ZONE,
+                ctl().KB_FOUR_MODE,
+                ctl().LOGO_COLOR,
+                ctl().PLATFORM_PROFILE,
+                ctl().PLATFORM_PROFILE_CHOICES,
+            )
+        }
+
     # RGB page
     def _build_rgb_page(
         self, notifier: StatusNotifier
@@ -477,7 +566,7 @@ class LinuwuApp(Adw.Application):
         PER_ZONE_DELAY_US = 400_000
 
         def _compute_per_zone_args() -> Optional[List[str]]:
-            if not path_exists(ctl.KB_PER_ZONE):
+            if not self._avail[ctl().KB_PER_ZONE]:
                 return None
             try:
                 brightness = int(bright_row.get_value())
@@ -538,11 +627,10 @@ class LinuwuApp(Adw.Application):
         eff_row.set_enable_expansion(False)
 
         # Mode Combo
-        mode_names = list(ctl.MODE_NAME_TO_ID.keys())
-        mode_store = Gtk.StringList.new(mode_names)
+        mode_store = Gtk.StringList.new(MODE_NAMES)
         mode_row = Adw.ComboRow(title="Mode")
         mode_row.set_model(mode_store)
-        mode_row.set_selected(mode_names.index("wave") if "wave" in mode_names else 0)
+        mode_row.set_selected(WAVE_INDEX)
         eff_row.add_row(mode_row)
 
         speed_row = Adw.SpinRow(
@@ -577,10 +665,10 @@ class LinuwuApp(Adw.Application):
         EFFECT_DELAY_US = 400_000
 
         def _compute_effect_args() -> Optional[List[str]]:
-            if not path_exists(ctl.KB_FOUR_MODE):
+            if not self._avail[ctl().KB_FOUR_MODE]:
                 return None
             try:
-                mode_name = mode_names[mode_row.get_selected()]
+                mode_name = MODE_NAMES[mode_row.get_selected()]
                 speed = int(speed_row.get_value())
                 brightness = int(bright2_row.get_value())
                 direction = int(dir_row.get_value())
@@ -691,13 +779,22 @@ class LinuwuApp(Adw.Application):
         )
 
         # Utilities: read current values from sysfs and populate UI
-        ID_TO_MODE = {v: k for k, v in ctl.MODE_NAME_TO_ID.items()}
+        ID_TO_MODE = {v: k for k, v in ctl().MODE_NAME_TO_ID.items()}
 
         def _refresh_keyboard() -> None:
+            # Gray out sections whose sysfs attribute is missing so the user
+            # sees disabled controls instead of a late write error. Applied on
+            # every refresh since a rescan re-probes self._avail and the
+            # module may have been (un)loaded since the page was built.
+            # Off uses per-zone.
+            per_row.set_sensitive(self._avail[ctl().KB_PER_ZONE])
+            eff_row.set_sensitive(self._avail[ctl().KB_FOUR_MODE])
+            off_row.set_sensitive(self._avail[ctl().KB_PER_ZONE])
+
             # Per-zone static
             try:
-                if path_exists(ctl.KB_PER_ZONE):
-                    raw = read_text(ctl.KB_PER_ZONE)
+                if self._avail[ctl().KB_PER_ZONE]:
+                    raw = read_text(ctl().KB_PER_ZONE)
                     parts = [p.strip() for p in raw.split(",") if p.strip()]
                     # Expect 5 parts: c1,c2,c3,c4,brightness
                     if len(parts) >= 5:
@@ -731,8 +828,8 @@ class LinuwuApp(Adw.Application):
 
             # Effect
             try:
-                if path_exists(ctl.KB_FOUR_MODE):
-                    raw = read_text(ctl.KB_FOUR_MODE)
+                if self._avail[ctl().KB_FOUR_MODE]:
+                    raw = read_text(ctl().KB_FOUR_MODE)
                     parts = [p.strip() for p in raw.split(",") if p.strip()]
                     # Expect 7 parts: mode,speed,brightness,dir,r,g,b
                     if len(parts) >= 7:
@@ -754,7 +851,7 @@ class LinuwuApp(Adw.Application):
                         if isinstance(mid, int) and mid in ID_TO_MODE:
                             name = ID_TO_MODE[mid]
                             try:
-                                idx = mode_names.index(name)
+                                idx = MODE_NAMES.index(name)
                                 mode_row.set_selected(idx)
                             except ValueError:
                                 pass
@@ -812,12 +909,7 @@ class LinuwuApp(Adw.Application):
         color_row.connect("notify::text", lambda *_: _effect_touch())
 
         # ---------------- Back logo section ----------------
-        def _build_logo_group() -> tuple[
-            Optional[Adw.PreferencesGroup], Callable[[], None]
-        ]:
-            if not path_exists(ctl.LOGO_COLOR):
-                return None, (lambda: None)
-
+        def _build_logo_group() -> tuple[Adw.PreferencesGroup, Callable[[], None]]:
             grp = Adw.PreferencesGroup(title="Back logo")
 
             logo_power = Adw.SwitchRow(title="Power")
@@ -894,30 +986,38 @@ class LinuwuApp(Adw.Application):
             logo_brightness.connect("notify::value", lambda *_: _logo_touch())
 
             def _refresh_logo() -> None:
-                ok, out = run_privileged(["logo", "get"])
-                if not ok or not out:
+                # Gray out the group when the attribute is missing; re-applied
+                # on every refresh since a rescan re-probes self._avail
+                available = self._avail[ctl().LOGO_COLOR]
+                grp.set_sensitive(available)
+                if not available:
                     return
-                try:
-                    hexcol, brt, en = [p.strip() for p in out.split(",")[:3]]
-                    if hexcol and len(hexcol) == 6:
-                        logo_color.set_text(hexcol)
+
+                def _on_logo_state(ok: bool, out: str) -> None:
+                    if not ok or not out:
+                        return
                     try:
-                        b = int(brt)
-                        if 0 <= b <= 100:
-                            logo_brightness.set_value(b)
+                        hexcol, brt, en = [p.strip() for p in out.split(",")[:3]]
+                        if hexcol and len(hexcol) == 6:
+                            logo_color.set_text(hexcol)
+                        try:
+                            b = int(brt)
+                            if 0 <= b <= 100:
+                                logo_brightness.set_value(b)
+                        except Exception:
+                            pass
+                        logo_power.set_active(en.strip() == "1")
                     except Exception:
                         pass
-                    logo_power.set_active(en.strip() == "1")
-                except Exception:
-                    pass
+
+                run_privileged_async(["logo", "get"], _on_logo_state)
 
             # Initial populate
             _refresh_logo()
             return grp, _refresh_logo
 
         logo_group, _refresh_logo = _build_logo_group()
-        if logo_group is not None:
-            page.add(logo_group)
+        page.add(logo_group)
 
         return page, (lambda: (_refresh_keyboard(), _refresh_logo()))
 
@@ -947,40 +1047,91 @@ class LinuwuApp(Adw.Application):
         battery_row.set_active(False)
         group.add(battery_row)
 
+        def _load_current() -> None:
+            # Async read of the current profile; sysfs reads need no privileges
+            # but a synchronous read would still block the GTK main loop.
+            def on_profile_loaded(src: Gio.File, res) -> None:
+                nonlocal current, power_refreshing
+                try:
+                    _ok, data, _etag = src.load_contents_finish(res)
+                    current = data.decode("utf-8", "ignore").strip()
+                except Exception:
+                    current = ""
+                # Guarded set to avoid triggering a write during refresh
+                prev = power_refreshing
+                power_refreshing = True
+                try:
+                    current_label.set_text(current or "unknown")
+                    if current in choices:
+                        combo.set_selected(choices.index(current))
+                    elif choices:
+                        combo.set_selected(0)
+                finally:
+                    power_refreshing = prev
+
+            if self._avail[ctl().PLATFORM_PROFILE]:
+                Gio.File.new_for_path(ctl().PLATFORM_PROFILE).load_contents_async(
+                    None, on_profile_loaded
+                )
+            else:
+                current_label.set_text("unknown")
+
         def refresh() -> None:
-            nonlocal choices, current
-            ok_list, list_out = run_privileged(["power", "list"])
-            if ok_list and list_out:
+            # Gray the profile controls when platform_profile is missing so
+            # selecting an entry can't hit a late "Missing platform_profile"
+            # error; re-applied on every refresh since a rescan re-probes
+            # self._avail.
+            profile_avail = self._avail[ctl().PLATFORM_PROFILE]
+            combo.set_sensitive(profile_avail)
+            row_current.set_sensitive(profile_avail)
+
+            # Populate the profile list asynchronously so do_activate can
+            # present the (empty) ComboRow immediately without waiting on the
+            # kernel to service the sysfs reads.
+            def _apply_choices(parsed: List[str]) -> None:
+                nonlocal choices, power_refreshing
+                choices = parsed or ["balanced", "performance", "power-saver"]
+                prev = power_refreshing
+                power_refreshing = True
+                try:
+                    store.splice(0, store.get_n_items(), choices)
+                finally:
+                    power_refreshing = prev
+                # Select the current profile only once choices are in place
+                _load_current()
+
+            def on_choices_loaded(src: Gio.File, res) -> None:
                 try:
-                    choices = [c for c in list_out.split() if c]
+                    _ok, data, _etag = src.load_contents_finish(res)
+                    parsed = [c for c in data.decode("utf-8", "ignore").split() if c]
                 except Exception:
-                    choices = []
+                    parsed = []
+                _apply_choices(parsed)
+
+            if self._avail[ctl().PLATFORM_PROFILE_CHOICES]:
+                Gio.File.new_for_path(
+                    ctl().PLATFORM_PROFILE_CHOICES
+                ).load_contents_async(None, on_choices_loaded)
             else:
-                choices = ["balanced", "performance", "power-saver"]
-            store.splice(0, store.get_n_items(), choices)
-            ok_cur, cur_out = run_privileged(["power", "get"])
-            current = cur_out if ok_cur and cur_out else ""
-            current_label.set_text(current or "unknown")
-            if current in choices:
-                combo.set_selected(choices.index(current))
-            elif choices:
-                combo.set_selected(0)
-
-            # Battery limiter status
-            ok_bat, bat_out = run_privileged(["battery", "get"])
-            try:
-                value = int(bat_out.strip()) if ok_bat and bat_out else 0
-            except Exception:
-                value = 0
-            # Guarded set to avoid triggering write during refresh
-            nonlocal power_refreshing
-            prev = power_refreshing
-            power_refreshing = True
-            try:
-                battery_row.set_sensitive(ok_bat)
-                battery_row.set_active(True if value == 1 else False)
-            finally:
-                power_refreshing = prev
+                _apply_choices([])
+
+            # Battery limiter status (needs the CLI helper; run off-thread)
+            def _on_battery_state(ok_bat: bool, bat_out: str) -> None:
+                nonlocal power_refreshing
+                try:
+                    value = int(bat_out.strip()) if ok_bat and bat_out else 0
+                except Exception:
+                    value = 0
+                # Guarded set to avoid triggering write during refresh
+                prev = power_refreshing
+                power_refreshing = True
+                try:
+                    battery_row.set_sensitive(ok_bat)
+                    battery_row.set_active(True if value == 1 else False)
+                finally:
+                    power_refreshing = prev
+
+            run_privileged_async(["battery", "get"], _on_battery_state)
 
         # Instant apply on selection changes with guard during refresh
         power_refreshing = False
@@ -997,10 +1148,17 @@ class LinuwuApp(Adw.Application):
                 )
                 if not sel:
                     return
+                # Selecting the already-active profile is a no-op; skip the
+                # write instead of bouncing it off the kernel
+                if sel == current:
+                    return
 
                 def _done(ok: bool, msg: str):
+                    nonlocal current
                     if ok:
                         notifier.info(f"Power profile set to {sel}")
+                        current = sel
+                        current_label.set_text(sel)
                     else:
                         notifier.error(msg)
 
@@ -1008,7 +1166,31 @@ class LinuwuApp(Adw.Application):
             except Exception as e:
                 notifier.error(f"Error: {e}")
 
-        combo.connect("notify::selected", lambda *_: _apply_power_from_combo())
+        # Debounce selection changes: stepping through the list with keyboard
+        # or scroll wheel fires notify::selected per step, and each profile
+        # write is an ACPI round-trip. Coalesce to the final selection.
+        power_debounce_id: Optional[int] = None
+
+        def _schedule_apply_power():
+            nonlocal power_debounce_id
+            if power_refreshing:
+                return
+            if power_debounce_id is not None:
+                try:
+                    GLib.source_remove(power_debounce_id)
+                except Exception:
+                    pass
+                power_debounce_id = None
+
+            def _timeout():
+                nonlocal power_debounce_id
+                power_debounce_id = None
+                _apply_power_from_combo()
+                return False
+
+            power_debounce_id = GLib.timeout_add(400, _timeout)
+
+        combo.connect("notify::selected", lambda *_: _schedule_apply_power())
 
         def _on_battery_toggle(*_):
             nonlocal power_refreshing
@@ -1041,17 +1223,24 @@ class LinuwuApp(Adw.Application):
 
         page.add(group)
 
-        # Wrap original refresh to set guard
-        def _wrapped_refresh():
-            nonlocal power_refreshing
-            power_refreshing = True
+        # Watch platform_profile so changes made outside the app (e.g. via
+        # powerprofilesctl) update the combo without polling; the kernel
+        # notifies on each actual change. Keep the monitor referenced on
+        # self so it is not garbage collected.
+        if self._avail[ctl().PLATFORM_PROFILE]:
             try:
-                refresh()
-            finally:
-                power_refreshing = False
+                monitor = Gio.File.new_for_path(ctl().PLATFORM_PROFILE).monitor_file(
+                    Gio.FileMonitorFlags.NONE, None
+                )
+                monitor.connect("changed", lambda *_a: _load_current())
+                self._profile_monitor = monitor
+            except Exception:
+                pass
 
-        _wrapped_refresh()
-        return page, _wrapped_refresh
+        # No wrapper guard needed: refresh() is asynchronous and each
+        # completion callback sets power_refreshing around its UI updates.
+        refresh()
+        return page, refresh
 
     # Fans page
     def _build_fans_page(
@@ -1146,6 +1335,7 @@ class LinuwuApp(Adw.Application):
         # Instant apply for fan changes (debounced) with refresh guard
         fans_debounce_id: Optional[int] = None
         fans_refreshing = False
+        last_fans_args: Optional[str] = None
 
         def _compute_fans_args() -> Optional[List[str]]:
             try:
@@ -1162,15 +1352,22 @@ class LinuwuApp(Adw.Application):
                 return None
 
         def _apply_fans_now():
+            nonlocal last_fans_args
             if fans_refreshing:
                 return
             args = _compute_fans_args()
             if not args:
                 return
+            # Idempotent clicks/toggles hit the EC for nothing; skip them
+            sig = " ".join(args)
+            if sig == last_fans_args:
+                return
 
             def _done(ok: bool, msg: str):
+                nonlocal last_fans_args
                 if ok:
                     notifier.info("Fan settings applied")
+                    last_fans_args = sig
                     refresh()
                 else:
                     notifier.error(msg)
@@ -1202,8 +1399,12 @@ class LinuwuApp(Adw.Application):
 
         def refresh() -> None:
             try:
-                nonlocal fans_refreshing, link_initialized
+                nonlocal fans_refreshing, link_initialized, last_fans_args
                 fans_refreshing = True
+                # Hardware may have been changed outside the app (e.g. the
+                # CLI); drop the cached signature so re-applying the same
+                # GUI values after a resync is not skipped as a duplicate
+                last_fans_args = None
                 p = detect_sense_fan_path()
                 if not p:
                     status_label.set_text("unavailable")